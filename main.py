@@ -1,30 +1,181 @@
-from flask import Flask, jsonify, request, send_from_directory
-from flask_cors import CORS
-import requests
-import json
+from quart import Quart, Response, make_response, request, send_from_directory
+from quart_cors import cors
+from brotli_asgi import BrotliMiddleware
+import httpx
+from urllib.parse import urlsplit
+import ijson
+import asyncio
+from contextlib import asynccontextmanager
+import fastjsonschema
+import inspect
+import orjson
 import os
+import re
+import tempfile
+import time
 from datetime import datetime, timedelta
 import random
+from types import MappingProxyType
 import google.generativeai as genai
+from cachetools import LRUCache, TTLCache
 
-app = Flask(__name__)
-CORS(app)
+app = Quart(__name__)
+app = cors(app)
+
+# Brotli (gzip fallback) for the text-heavy chat replies; the SSE route is excluded so deltas aren't buffered
+app.asgi_app = BrotliMiddleware(
+    app.asgi_app,
+    minimum_size=256,
+    gzip_fallback=True,
+    excluded_handlers=[r'^/api/space-chat/stream$'],
+)
+
+# Shared async HTTP client so concurrent handlers reuse pooled keep-alive connections to NASA/SpaceX
+RETRY_STATUSES = {502, 503, 504}
+client = httpx.AsyncClient(
+    timeout=10,
+    headers={'Accept-Encoding': 'gzip'},
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=30),
+    ),
+)
+
+# After a 429, calls to that host are skipped until the time recorded here (host -> epoch seconds)
+RATE_LIMIT_BACKOFF = 3600
+rate_limited_until = {}
+
+class UpstreamRateLimited(Exception):
+    """Raised instead of calling a host that recently answered 429 Too Many Requests"""
+
+    def __init__(self, host, until):
+        super().__init__(f"{host} is rate limited for another {until - time.time():.0f}s")
+        self.until = until
+
+@asynccontextmanager
+async def fetch_stream(url, retries=2, backoff_factor=0.2):
+    """Open a streamed GET on the shared client, retrying transient upstream gateway errors"""
+    host = urlsplit(url).hostname
+    until = rate_limited_until.get(host, 0)
+    if until > time.time():
+        raise UpstreamRateLimited(host, until)
+    for attempt in range(retries + 1):
+        async with client.stream('GET', url) as response:
+            if response.status_code == 429:
+                retry_after = response.headers.get('Retry-After', '')
+                delay = int(retry_after) if retry_after.isdigit() else RATE_LIMIT_BACKOFF
+                until = rate_limited_until[host] = time.time() + delay
+                raise UpstreamRateLimited(host, until)
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                yield response
+                return
+        await asyncio.sleep(backoff_factor * (2 ** attempt))
+
+async def fetch(url, retries=2, backoff_factor=0.2):
+    """GET a URL on the shared client with the same retry policy, reading the whole body"""
+    async with fetch_stream(url, retries, backoff_factor) as response:
+        await response.aread()
+        return response
+
+# Upstream payloads are cached per URL, each for longer than its prefetch interval below.
+# NASA's DEMO_KEY allows 50 calls per day per IP, so APOD and NEO are refreshed sparingly.
+APOD_CACHE = TTLCache(maxsize=4, ttl=65 * 60)
+NEO_CACHE = TTLCache(maxsize=4, ttl=3 * 3600)
+SPACEX_CACHE = TTLCache(maxsize=4, ttl=300)
+
+async def refresh_json(url, cache):
+    """Fetch a URL and store its JSON body in the cache, returning None on failure"""
+    response = await fetch(url)
+    if response.status_code != 200:
+        return None
+    data = cache[url] = orjson.loads(response.content)
+    return data
+
+# ijson prefix of each asteroid in the single-day feed: near_earth_objects.<date>.item
+NEO_ITEM_PREFIX = re.compile(r'near_earth_objects\.[^.]+\.item')
+
+class AsyncByteReader:
+    """Expose an async byte iterator as the file-like object ijson reads from"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def read(self, size=-1):
+        if size == 0:
+            # ijson probes with read(0) to detect bytes vs str; don't consume a chunk for it
+            return b''
+        return await anext(self.chunks, b'')
+
+async def refresh_neo_feed(url, cache):
+    """Stream the NEO feed, caching only its element count and first asteroid, returning None on failure"""
+    element_count = None
+    featured = None
+    builder = None
+    async with fetch_stream(url) as response:
+        if response.status_code != 200:
+            return None
+        async for prefix, event, value in ijson.parse(AsyncByteReader(response.aiter_bytes())):
+            if prefix == 'element_count':
+                element_count = value
+            elif builder is None and featured is None and event == 'start_map' and NEO_ITEM_PREFIX.fullmatch(prefix):
+                builder = ijson.ObjectBuilder()
+                featured_prefix = prefix
+            if builder is not None:
+                builder.event(event, value)
+                if event == 'end_map' and prefix == featured_prefix:
+                    featured, builder = builder.value, None
+            if element_count is not None and featured is not None:
+                break
+    if element_count is None:
+        return None
+    data = cache[url] = {'element_count': element_count, 'featured': featured}
+    return data
+
+async def fetch_json(url, cache, refresh=refresh_json):
+    """Return the JSON body of a successful GET, served from cache while fresh"""
+    data = cache.get(url)
+    if data is None:
+        data = await refresh(url, cache)
+    return data
 
 # NASA API endpoints (most are free, no API key required)
 NASA_APOD_API = "https://api.nasa.gov/planetary/apod?api_key=DEMO_KEY"
 NASA_NEO_API = "https://api.nasa.gov/neo/rest/v1/feed?api_key=DEMO_KEY"
+NASA_NEO_FEED_TEMPLATE = "https://api.nasa.gov/neo/rest/v1/feed?start_date={d}&end_date={d}&api_key=DEMO_KEY"
 NASA_MARS_API = "https://api.nasa.gov/mars-photos/api/v1/rovers/curiosity/photos?sol=1000&api_key=DEMO_KEY"
 NASA_EARTH_API = "https://api.nasa.gov/planetary/earth/assets?lon=-95.33&lat=29.78&dim=0.10&api_key=DEMO_KEY"
 
 # ISRO-related news and info (using general space news APIs since ISRO doesn't have open APIs)
 SPACE_NEWS_API = "https://api.spacexdata.com/v4/launches/latest"
 
+# Dedicated PRNG for picking fallback facts
+RNG = random.Random()
+
+# Upper bound in seconds on a single Gemini call so slow generations can't pile up
+GEMINI_TIMEOUT = 30
+
+# Gemini answers keyed by normalized question (per worker process)
+GEMINI_CACHE = LRUCache(maxsize=2048)
+
+# Space-expert persona sent once as the system instruction, so each call only carries the user's question
+SPACE_SYSTEM_INSTRUCTION = """You are VyomNetra, an expert space and astronomy chatbot. Answer questions about space, astronomy, constellations, planets, or any space-related topic with accurate, engaging information. Keep your response informative but friendly, include relevant emojis, and make it educational.
+
+If it's about a constellation, include information about its stars, mythology, and how to find it. If it's about planets, include facts about their characteristics and any NASA missions. Keep answers under about 250 words so they are never cut off."""
+
+# Bounded output keeps Gemini latency and cost predictable
+GENERATION_CONFIG = genai.GenerationConfig(max_output_tokens=400, temperature=0.7, top_p=0.9)
+
 # Initialize Google Gemini with your API key
 try:
     google_api_key = os.environ.get('GOOGLE_API_KEY')
     if google_api_key:
         genai.configure(api_key=google_api_key)
-        model = genai.GenerativeModel('gemini-2.0-flash')
+        model = genai.GenerativeModel(
+            'gemini-2.0-flash',
+            system_instruction=SPACE_SYSTEM_INSTRUCTION,
+            generation_config=GENERATION_CONFIG,
+        )
         print("🤖 Google Gemini AI integrated successfully with your API key!")
     else:
         print("⚠️ No Google API key found, using basic responses")
@@ -33,126 +184,261 @@ except Exception as e:
     print(f"⚠️ Gemini setup error: {e}")
     model = None
 
+# Chat payloads are validated at the edge so oversized or malformed input never reaches a handler
+MAX_MESSAGE_LENGTH = 2000
+app.config['MAX_CONTENT_LENGTH'] = 64 * 1024
+validate_chat_request = fastjsonschema.compile({
+    'type': 'object',
+    'properties': {'message': {'type': 'string', 'maxLength': MAX_MESSAGE_LENGTH}},
+    'required': ['message'],
+})
+
+def jsonify_fast(obj):
+    """Serialize a JSON response with orjson instead of the stdlib encoder"""
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
+# Feeds kept warm in the background: (URL builder, cache, refresher, refresh interval in seconds).
+# APOD rolls over at midnight US Eastern, so it is re-checked hourly: 24 APOD + 12 NEO calls a day.
+PREFETCH_FEEDS = [
+    (lambda: NASA_APOD_API, APOD_CACHE, refresh_json, 3600),
+    (lambda: NASA_NEO_FEED_TEMPLATE.format(d=today_utc()), NEO_CACHE, refresh_neo_feed, 2 * 3600),
+    (lambda: SPACE_NEWS_API, SPACEX_CACHE, refresh_json, 240),
+]
+PREFETCH_RETRY_DELAY = 60
+prefetch_tasks = []
+prefetch_lock = []
+
+def acquire_prefetch_lock():
+    """Return True in only one worker process per host, so upstream feeds are prefetched once"""
+    try:
+        import fcntl
+    except ImportError:
+        return True
+    lock_file = open(os.path.join(tempfile.gettempdir(), 'vyomnetra-prefetch.lock'), 'w')
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    # Held open for the life of the process; the OS releases the lock when it exits
+    prefetch_lock.append(lock_file)
+    return True
+
+async def prefetch_loop(build_url, cache, refresh, interval):
+    """Refresh one upstream feed on its schedule, retrying soon after failures and backing off while rate limited"""
+    failures = 0
+    while True:
+        try:
+            if await refresh(build_url(), cache) is None:
+                raise RuntimeError("upstream returned an unusable response")
+            failures = 0
+            delay = interval
+        except UpstreamRateLimited as e:
+            print(f"Prefetch paused: {e}")
+            delay = max(interval, e.until - time.time())
+        except Exception as e:
+            # Short exponential backoff, never longer than the normal interval
+            failures += 1
+            delay = min(PREFETCH_RETRY_DELAY * 2 ** (failures - 1), interval)
+            print(f"Prefetch error (retrying in {delay:.0f}s): {e}")
+        await asyncio.sleep(delay)
+
+@app.before_serving
+async def start_prefetch():
+    """Warm the upstream caches so users rarely wait on NASA/SpaceX"""
+    if not acquire_prefetch_lock():
+        return
+    for build_url, cache, refresh, interval in PREFETCH_FEEDS:
+        prefetch_tasks.append(asyncio.create_task(prefetch_loop(build_url, cache, refresh, interval)))
+
+@app.after_serving
+async def close_client():
+    """Stop background prefetching and close the shared HTTP client when the server shuts down"""
+    for task in prefetch_tasks:
+        task.cancel()
+    await client.aclose()
+
 @app.route('/')
-def index():
+async def index():
     """Serve the main HTML file"""
-    return send_from_directory('.', 'index.html')
+    return await send_from_directory('.', 'index.html')
 
 @app.route('/api/space-chat', methods=['POST'])
-def space_chat():
+async def space_chat():
     """
     Handle chat messages and return space-related responses from NASA/ISRO data
     """
     try:
-        data = request.get_json()
-        user_message = data.get('message', '').lower()
+        data = orjson.loads(await request.get_data())
+        validate_chat_request(data)
+    except (orjson.JSONDecodeError, fastjsonschema.JsonSchemaException) as e:
+        return jsonify_fast({'error': f"Invalid chat request: {e}"}), 400
+    
+    try:
+        user_message = normalize_message(data['message'])
         
-        # Determine what type of space information to fetch based on user message
-        if 'apod' in user_message or 'picture' in user_message or 'photo' in user_message or 'image' in user_message:
-            response = get_nasa_apod()
-        elif 'asteroid' in user_message or 'neo' in user_message or 'near earth' in user_message:
-            response = get_nasa_neo_data()
-        elif 'mars' in user_message or 'rover' in user_message or 'curiosity' in user_message:
-            response = get_mars_rover_data()
-        elif 'spacex' in user_message or 'launch' in user_message or 'rocket' in user_message:
-            response = get_spacex_launch_data()
-        elif 'isro' in user_message or 'indian space' in user_message or 'india' in user_message:
-            response = get_isro_info()
-        elif any(constellation in user_message for constellation in ['ursa major', 'ursa minor', 'orion', 'cassiopeia', 'andromeda', 'constellation', 'big dipper', 'little dipper']):
-            response = get_constellation_info(user_message)
-        elif any(planet in user_message for planet in ['mercury', 'venus', 'earth', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'planet']):
-            response = get_planet_info(user_message)
-        elif any(term in user_message for term in ['star', 'sun', 'supernova', 'neutron star', 'white dwarf', 'black hole']):
-            response = get_stellar_info(user_message)
-        elif any(term in user_message for term in ['galaxy', 'milky way', 'andromeda galaxy', 'spiral galaxy']):
-            response = get_galaxy_info(user_message)
-        else:
-            # Use AI to answer any space question intelligently
-            response = get_smart_space_answer(user_message)
+        response = await answer_space_message(user_message)
             
-        return jsonify({
+        return jsonify_fast({
             'response': response,
             'timestamp': datetime.now().isoformat()
         })
         
     except Exception as e:
-        return jsonify({
+        return jsonify_fast({
             'response': f"I'm having trouble connecting to space agencies right now, but here's an interesting space fact: The universe is about 13.8 billion years old and contains over 2 trillion galaxies! 🌌 Error details: {str(e)}",
             'timestamp': datetime.now().isoformat()
         }), 200
 
-def get_nasa_apod():
+@app.route('/api/space-chat/stream')
+async def space_chat_stream():
+    """
+    Stream a chat answer to the browser as Server-Sent Events, token by token for Gemini answers
+    """
+    try:
+        validate_chat_request(request.args.to_dict())
+    except fastjsonschema.JsonSchemaException as e:
+        return jsonify_fast({'error': f"Invalid chat request: {e}"}), 400
+    user_message = normalize_message(request.args['message'])
+    
+    async def events():
+        async for delta in stream_space_answer(user_message):
+            yield b'data: ' + orjson.dumps({'delta': delta}) + b'\n\n'
+        yield b'data: ' + orjson.dumps({'done': True}) + b'\n\n'
+    
+    response = await make_response(events(), {'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache'})
+    response.timeout = None
+    return response
+
+async def answer_space_message(user_message, intents=None):
+    """Route a normalized chat message to every matching space data source at once"""
+    if intents is None:
+        intents = match_intents(user_message)
+    if not intents:
+        # Use AI to answer any space question intelligently
+        return await get_smart_space_answer(user_message)
+    
+    # Fetch every requested topic concurrently so latency is that of the slowest source
+    parts = await asyncio.gather(*(run_intent(handler, user_message) for handler in intents), return_exceptions=True)
+    answers = [part for part in parts if not isinstance(part, Exception)]
+    return INTENT_SEPARATOR.join(answers) if answers else get_random_space_fact()
+
+async def run_intent(handler, user_message):
+    """Call an intent handler, awaiting it if it fetches remote data"""
+    response = handler(user_message)
+    if inspect.isawaitable(response):
+        response = await response
+    return response
+
+async def stream_space_answer(user_message):
+    """Yield the answer to a chat message in chunks as they become available"""
+    intents = match_intents(user_message)
+    if model is None or user_message in GEMINI_CACHE or intents:
+        yield await answer_space_message(user_message, intents)
+        return
+    
+    chunks = []
+    try:
+        # One deadline covers the whole generation; each wait gets whatever time is left of it
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + GEMINI_TIMEOUT
+        response = await asyncio.wait_for(model.generate_content_async(user_message, stream=True), timeout=GEMINI_TIMEOUT)
+        stream = aiter(response)
+        while (chunk := await asyncio.wait_for(anext(stream, None), timeout=max(deadline - loop.time(), 0))) is not None:
+            chunks.append(chunk.text)
+            yield chunk.text
+        GEMINI_CACHE[user_message] = ''.join(chunks)
+    except Exception as e:
+        print(f"Gemini AI error: {e}")
+        if not chunks:
+            yield get_random_space_fact()
+
+async def get_nasa_apod():
     """Get NASA Astronomy Picture of the Day"""
     try:
-        response = requests.get(NASA_APOD_API, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
+        data = await fetch_json(NASA_APOD_API, APOD_CACHE)
+        if data is not None:
             return f"🌟 **NASA's Astronomy Picture of the Day**: {data.get('title', 'Amazing Space Image')}\n\n{data.get('explanation', 'A beautiful view from space!')}\n\n📅 Date: {data.get('date', 'Today')}\n🔗 You can view it at: {data.get('url', 'NASA APOD website')}"
         else:
             return get_fallback_apod_info()
     except:
         return get_fallback_apod_info()
 
+APOD_FACTS = (
+    "🌟 **NASA's APOD Program**: Every day since 1995, NASA has featured a different image or photograph of our fascinating universe, along with a brief explanation written by a professional astronomer!",
+    "📸 **Did you know?** NASA's Astronomy Picture of the Day has featured over 10,000 stunning images of space, from distant galaxies to planets in our solar system!",
+    "🔭 **APOD Archive**: The NASA APOD archive contains decades of the most beautiful space images ever captured, each with detailed explanations from astronomers!"
+)
+
 def get_fallback_apod_info():
     """Fallback APOD information when API fails"""
-    apod_facts = [
-        "🌟 **NASA's APOD Program**: Every day since 1995, NASA has featured a different image or photograph of our fascinating universe, along with a brief explanation written by a professional astronomer!",
-        "📸 **Did you know?** NASA's Astronomy Picture of the Day has featured over 10,000 stunning images of space, from distant galaxies to planets in our solar system!",
-        "🔭 **APOD Archive**: The NASA APOD archive contains decades of the most beautiful space images ever captured, each with detailed explanations from astronomers!"
-    ]
-    return random.choice(apod_facts)
-
-def get_nasa_neo_data():
+    return RNG.choice(APOD_FACTS)
+
+# Today's UTC date string, recomputed at most once a minute
+TODAY_UTC = {'date': '', 'checked': 0.0}
+
+def today_utc():
+    """Return today's UTC date as YYYY-MM-DD"""
+    now = time.time()
+    if now - TODAY_UTC['checked'] > 60:
+        TODAY_UTC['date'] = time.strftime('%Y-%m-%d', time.gmtime(now))
+        TODAY_UTC['checked'] = now
+    return TODAY_UTC['date']
+
+async def get_nasa_neo_data():
     """Get NASA Near Earth Objects data"""
     try:
         # Use today's date for NEO feed
-        today = datetime.now().strftime('%Y-%m-%d')
-        neo_url = f"https://api.nasa.gov/neo/rest/v1/feed?start_date={today}&end_date={today}&api_key=DEMO_KEY"
+        today = today_utc()
         
-        response = requests.get(neo_url, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            element_count = data.get('element_count', 0)
-            if element_count > 0:
-                neo_objects = data.get('near_earth_objects', {}).get(today, [])
-                if neo_objects:
-                    neo = neo_objects[0]  # Get first NEO
-                    name = neo.get('name', 'Unknown asteroid')
-                    diameter = neo.get('estimated_diameter', {}).get('meters', {})
-                    min_diameter = diameter.get('estimated_diameter_min', 0)
-                    max_diameter = diameter.get('estimated_diameter_max', 0)
-                    
-                    return f"🌌 **NASA NEO Update**: Today, there are {element_count} Near Earth Objects being tracked!\n\n🪨 **Featured Asteroid**: {name}\n📏 **Estimated Size**: {min_diameter:.1f} - {max_diameter:.1f} meters\n\n⚠️ NASA continuously monitors these objects to ensure Earth's safety! All current NEOs pose no threat to our planet."
-                    
+        data = await fetch_json(NASA_NEO_FEED_TEMPLATE.format(d=today), NEO_CACHE, refresh_neo_feed)
+        if data is not None:
+            element_count = data['element_count']
+            neo = data['featured']  # First NEO of the day
+            if element_count > 0 and neo:
+                name = neo.get('name', 'Unknown asteroid')
+                diameter = neo.get('estimated_diameter', {}).get('meters', {})
+                min_diameter = diameter.get('estimated_diameter_min', 0)
+                max_diameter = diameter.get('estimated_diameter_max', 0)
+                
+                return f"🌌 **NASA NEO Update**: Today, there are {element_count} Near Earth Objects being tracked!\n\n🪨 **Featured Asteroid**: {name}\n📏 **Estimated Size**: {min_diameter:.1f} - {max_diameter:.1f} meters\n\n⚠️ NASA continuously monitors these objects to ensure Earth's safety! All current NEOs pose no threat to our planet."
+                
         return get_fallback_neo_info()
     except:
         return get_fallback_neo_info()
 
+NEO_FACTS = (
+    "🪨 **NASA NEO Program**: NASA tracks over 90% of near-Earth asteroids larger than 1 km. None of the known objects pose a threat to Earth for the next 100+ years!",
+    "🌌 **Asteroid Facts**: There are currently over 28,000 known near-Earth asteroids. NASA discovers about 3,000 new ones each year using ground and space-based telescopes!",
+    "🛡️ **Planetary Defense**: NASA's DART mission successfully changed an asteroid's orbit in 2022, proving we can defend Earth if needed!"
+)
+
 def get_fallback_neo_info():
     """Fallback NEO information"""
-    neo_facts = [
-        "🪨 **NASA NEO Program**: NASA tracks over 90% of near-Earth asteroids larger than 1 km. None of the known objects pose a threat to Earth for the next 100+ years!",
-        "🌌 **Asteroid Facts**: There are currently over 28,000 known near-Earth asteroids. NASA discovers about 3,000 new ones each year using ground and space-based telescopes!",
-        "🛡️ **Planetary Defense**: NASA's DART mission successfully changed an asteroid's orbit in 2022, proving we can defend Earth if needed!"
-    ]
-    return random.choice(neo_facts)
+    return RNG.choice(NEO_FACTS)
+
+MARS_FACTS = (
+    "🔴 **Mars Rover Update**: NASA's Perseverance rover is currently exploring Jezero Crater, searching for signs of ancient microbial life and collecting samples for future return to Earth!",
+    "🤖 **Rover Fleet**: NASA has successfully operated 5 rovers on Mars: Sojourner, Spirit, Opportunity, Curiosity, and Perseverance. Ingenuity helicopter made the first powered flight on another planet!",
+    "🧪 **Mars Discovery**: NASA's rovers have confirmed that Mars once had flowing water, a thicker atmosphere, and conditions that could have supported life billions of years ago!",
+    "📡 **Current Mission**: Perseverance has collected over 20 rock samples and Ingenuity has completed over 50 flights, far exceeding its planned 5 flights!"
+)
 
 def get_mars_rover_data():
     """Get Mars rover information"""
-    mars_facts = [
-        "🔴 **Mars Rover Update**: NASA's Perseverance rover is currently exploring Jezero Crater, searching for signs of ancient microbial life and collecting samples for future return to Earth!",
-        "🤖 **Rover Fleet**: NASA has successfully operated 5 rovers on Mars: Sojourner, Spirit, Opportunity, Curiosity, and Perseverance. Ingenuity helicopter made the first powered flight on another planet!",
-        "🧪 **Mars Discovery**: NASA's rovers have confirmed that Mars once had flowing water, a thicker atmosphere, and conditions that could have supported life billions of years ago!",
-        "📡 **Current Mission**: Perseverance has collected over 20 rock samples and Ingenuity has completed over 50 flights, far exceeding its planned 5 flights!"
-    ]
-    return random.choice(mars_facts)
-
-def get_spacex_launch_data():
+    return RNG.choice(MARS_FACTS)
+
+SPACEX_FACTS = (
+    "🚀 **SpaceX Achievements**: SpaceX has revolutionized space travel with reusable rockets, reducing launch costs by 90% and making space more accessible than ever before!",
+    "🌌 **Starship Program**: SpaceX is developing Starship, the most powerful rocket ever built, designed to carry humans to Mars and make life multiplanetary!",
+    "🛰️ **Starlink Network**: SpaceX has deployed over 5,000 Starlink satellites, providing high-speed internet to remote areas worldwide and supporting global connectivity!"
+)
+
+async def get_spacex_launch_data():
     """Get SpaceX launch information"""
     try:
-        response = requests.get(SPACE_NEWS_API, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
+        data = await fetch_json(SPACE_NEWS_API, SPACEX_CACHE)
+        if data is not None:
             mission_name = data.get('name', 'Unknown Mission')
             launch_date = data.get('date_utc', 'Unknown Date')
             details = data.get('details', 'No details available')
@@ -164,134 +450,190 @@ def get_spacex_launch_data():
     except:
         pass
     
-    spacex_facts = [
-        "🚀 **SpaceX Achievements**: SpaceX has revolutionized space travel with reusable rockets, reducing launch costs by 90% and making space more accessible than ever before!",
-        "🌌 **Starship Program**: SpaceX is developing Starship, the most powerful rocket ever built, designed to carry humans to Mars and make life multiplanetary!",
-        "🛰️ **Starlink Network**: SpaceX has deployed over 5,000 Starlink satellites, providing high-speed internet to remote areas worldwide and supporting global connectivity!"
-    ]
-    return random.choice(spacex_facts)
+    return RNG.choice(SPACEX_FACTS)
+
+ISRO_FACTS = (
+    "🇮🇳 **ISRO Achievements**: India's Mars Orbiter Mission (Mangalyaan) made India the first country to reach Mars orbit in its first attempt, and the most cost-effective Mars mission ever at just $74 million!",
+    "🚀 **Chandrayaan Program**: ISRO's Chandrayaan-3 successfully landed on the Moon's south pole in 2023, making India the 4th country to land on the Moon and the first to reach the lunar south pole!",
+    "🛰️ **PSLV Success**: ISRO's Polar Satellite Launch Vehicle has achieved over 95% success rate and holds the record for launching 104 satellites in a single mission!",
+    "🌍 **Global Impact**: ISRO provides crucial Earth observation data for disaster management, weather forecasting, and agricultural monitoring, serving not just India but the entire world!",
+    "💫 **Future Missions**: ISRO is planning Gaganyaan (human spaceflight program), Shukrayaan-1 (Venus mission), and Chandrayaan-4 (Moon sample return mission)!"
+)
 
 def get_isro_info():
     """Get ISRO (Indian Space Research Organization) information"""
-    isro_facts = [
-        "🇮🇳 **ISRO Achievements**: India's Mars Orbiter Mission (Mangalyaan) made India the first country to reach Mars orbit in its first attempt, and the most cost-effective Mars mission ever at just $74 million!",
-        "🚀 **Chandrayaan Program**: ISRO's Chandrayaan-3 successfully landed on the Moon's south pole in 2023, making India the 4th country to land on the Moon and the first to reach the lunar south pole!",
-        "🛰️ **PSLV Success**: ISRO's Polar Satellite Launch Vehicle has achieved over 95% success rate and holds the record for launching 104 satellites in a single mission!",
-        "🌍 **Global Impact**: ISRO provides crucial Earth observation data for disaster management, weather forecasting, and agricultural monitoring, serving not just India but the entire world!",
-        "💫 **Future Missions**: ISRO is planning Gaganyaan (human spaceflight program), Shukrayaan-1 (Venus mission), and Chandrayaan-4 (Moon sample return mission)!"
-    ]
-    return random.choice(isro_facts)
+    return RNG.choice(ISRO_FACTS)
+
+SPACE_FACTS = (
+    "🌌 **NASA Discovery**: The James Webb Space Telescope has detected galaxies that formed just 400 million years after the Big Bang, giving us unprecedented views of the early universe!",
+    "⭐ **Stellar Facts**: According to NASA data, there are more stars in the observable universe than grains of sand on all Earth's beaches - approximately 10^24 stars!",
+    "🌍 **Earth Science**: NASA Earth observing satellites have shown that Earth's ice sheets are losing mass at an accelerating rate, with critical implications for sea level rise!",
+    "🪐 **Solar System**: NASA's Juno mission revealed that Jupiter has a 'fuzzy' core and produces auroras 1000 times brighter than Earth's!",
+    "🚀 **ISS Updates**: The International Space Station travels at 17,500 mph, completing an orbit around Earth every 90 minutes. Astronauts see 16 sunrises and sunsets daily!",
+    "🌟 **Exoplanet Hunt**: NASA has confirmed over 5,000 exoplanets so far, with many potentially habitable worlds in the 'Goldilocks zone' of their stars!"
+)
 
 def get_random_space_fact():
     """Get random space facts with data context"""
-    space_facts = [
-        "🌌 **NASA Discovery**: The James Webb Space Telescope has detected galaxies that formed just 400 million years after the Big Bang, giving us unprecedented views of the early universe!",
-        "⭐ **Stellar Facts**: According to NASA data, there are more stars in the observable universe than grains of sand on all Earth's beaches - approximately 10^24 stars!",
-        "🌍 **Earth Science**: NASA Earth observing satellites have shown that Earth's ice sheets are losing mass at an accelerating rate, with critical implications for sea level rise!",
-        "🪐 **Solar System**: NASA's Juno mission revealed that Jupiter has a 'fuzzy' core and produces auroras 1000 times brighter than Earth's!",
-        "🚀 **ISS Updates**: The International Space Station travels at 17,500 mph, completing an orbit around Earth every 90 minutes. Astronauts see 16 sunrises and sunsets daily!",
-        "🌟 **Exoplanet Hunt**: NASA has confirmed over 5,000 exoplanets so far, with many potentially habitable worlds in the 'Goldilocks zone' of their stars!"
-    ]
-    return random.choice(space_facts)
+    return RNG.choice(SPACE_FACTS)
+
+def compile_fact_lookup(facts):
+    """Compile a fact table into a (pattern, answers) pair: one capture group per key, in table order"""
+    pattern = re.compile('(?=' + '|'.join(f'({re.escape(key)})' for key in facts) + ')')
+    return pattern, tuple(facts.values())
+
+def lookup_fact(lookup, user_message):
+    """Return the fact for the first key (in table order) mentioned in the message, or None"""
+    pattern, answers = lookup
+    # Group numbers are table positions, so the lowest one seen is the highest-priority key
+    first = min((m.lastindex for m in pattern.finditer(user_message)), default=None)
+    return None if first is None else answers[first - 1]
+
+CONSTELLATIONS = MappingProxyType({
+    'ursa major': "🐻 **Ursa Major (The Great Bear)**: One of the most recognizable constellations! It contains the famous Big Dipper asterism - 7 bright stars that form a ladle shape. Located in the northern sky, it's visible year-round from most northern latitudes. The Big Dipper's pointer stars (Merak and Dubhe) help locate Polaris, the North Star. In mythology, it represents a great bear being hunted across the sky.",
+    'big dipper': "✨ **The Big Dipper**: This isn't actually a constellation but an asterism (star pattern) within Ursa Major! The seven stars - Alkaid, Mizar, Alioth, Megrez, Phecda, Merak, and Dubhe - form the famous ladle shape. Interestingly, 5 of these stars are part of the Ursa Major Moving Group, traveling through space together.",
+    'ursa minor': "🐻 **Ursa Minor (The Little Bear)**: Home to Polaris, the North Star! This constellation contains the Little Dipper asterism. Polaris sits nearly at the north celestial pole, making it appear stationary while other stars rotate around it. Ancient navigators have used Polaris for centuries to find true north.",
+    'orion': "⭐ **Orion (The Hunter)**: Perhaps the most famous constellation! Visible worldwide, it features the iconic three stars of Orion's Belt (Alnitak, Alnilam, Mintaka). The red supergiant Betelgeuse marks his shoulder, while blue-white Rigel marks his foot. The Orion Nebula (M42) is a stellar nursery where new stars are born!",
+    'cassiopeia': "👑 **Cassiopeia (The Queen)**: This distinctive W-shaped constellation is easy to spot in the northern sky! It's circumpolar from most northern latitudes, meaning it never sets. In mythology, Cassiopeia was a vain queen. The constellation helps locate Polaris and is opposite the Big Dipper across the north celestial pole.",
+    'andromeda': "🌌 **Andromeda (The Princess)**: This constellation is famous for containing the Andromeda Galaxy (M31), our nearest major galactic neighbor! The galaxy is visible to the naked eye as a fuzzy patch. In mythology, Andromeda was a princess chained to a rock as sacrifice to a sea monster, but was saved by Perseus.",
+    'scorpio': "🦂 **Scorpio (The Scorpion)**: A spectacular zodiac constellation visible in summer! Its brightest star is Antares, a red supergiant 700 times the size of our Sun. The constellation looks like a scorpion with a curved tail and claws. In mythology, it's the scorpion that killed Orion the Hunter. Best viewed in July and August in the southern sky!",
+    'scorpius': "🦂 **Scorpio (The Scorpion)**: A spectacular zodiac constellation visible in summer! Its brightest star is Antares, a red supergiant 700 times the size of our Sun. The constellation looks like a scorpion with a curved tail and claws. In mythology, it's the scorpion that killed Orion the Hunter. Best viewed in July and August in the southern sky!",
+    'leo': "🦁 **Leo (The Lion)**: A bright zodiac constellation that really looks like a lion! Its brightest star Regulus marks the lion's heart. The 'Sickle' asterism forms the lion's mane and head. Leo is home to many galaxies and the annual Leonid meteor shower in November. Best seen in spring evenings!",
+    'virgo': "♍ **Virgo (The Virgin)**: The second-largest constellation in the sky! Its brightest star Spica is actually a binary star system. Virgo contains over 1,300 galaxies in the Virgo Cluster. In mythology, Virgo represents the goddess of harvest. Best visible in late spring and early summer!",
+    'gemini': "♊ **Gemini (The Twins)**: Features the bright stars Castor and Pollux, representing the twin brothers in Greek mythology! Gemini is a zodiac constellation best seen in winter. It's home to the beautiful open star cluster M35 and was the radiant point for the 2020 SpaceX mission naming!",
+    'cancer': "🦀 **Cancer (The Crab)**: The faintest zodiac constellation, but it contains the beautiful Beehive Cluster (M44)! In mythology, it's the crab that pinched Hercules during his battle with the Hydra. Cancer is best seen in late winter and early spring between Gemini and Leo!",
+    'aquarius': "🏺 **Aquarius (The Water Bearer)**: A large zodiac constellation known for meteor showers! Home to the radiant points of several meteor showers including the Aquarids. Its brightest star is Sadalsuud. Best viewed in autumn evenings in the southern sky!",
+    'pisces': "🐟 **Pisces (The Fishes)**: A large but faint zodiac constellation representing two fish tied together! Contains the vernal equinox point where the Sun crosses the celestial equator in spring. Best seen in autumn evenings, though it requires dark skies due to its faint stars!"
+})
+CONSTELLATION_LOOKUP = compile_fact_lookup(CONSTELLATIONS)
 
 def get_constellation_info(user_message):
     """Get information about constellations"""
-    constellation_data = {
-        'ursa major': "🐻 **Ursa Major (The Great Bear)**: One of the most recognizable constellations! It contains the famous Big Dipper asterism - 7 bright stars that form a ladle shape. Located in the northern sky, it's visible year-round from most northern latitudes. The Big Dipper's pointer stars (Merak and Dubhe) help locate Polaris, the North Star. In mythology, it represents a great bear being hunted across the sky.",
-        'big dipper': "✨ **The Big Dipper**: This isn't actually a constellation but an asterism (star pattern) within Ursa Major! The seven stars - Alkaid, Mizar, Alioth, Megrez, Phecda, Merak, and Dubhe - form the famous ladle shape. Interestingly, 5 of these stars are part of the Ursa Major Moving Group, traveling through space together.",
-        'ursa minor': "🐻 **Ursa Minor (The Little Bear)**: Home to Polaris, the North Star! This constellation contains the Little Dipper asterism. Polaris sits nearly at the north celestial pole, making it appear stationary while other stars rotate around it. Ancient navigators have used Polaris for centuries to find true north.",
-        'orion': "⭐ **Orion (The Hunter)**: Perhaps the most famous constellation! Visible worldwide, it features the iconic three stars of Orion's Belt (Alnitak, Alnilam, Mintaka). The red supergiant Betelgeuse marks his shoulder, while blue-white Rigel marks his foot. The Orion Nebula (M42) is a stellar nursery where new stars are born!",
-        'cassiopeia': "👑 **Cassiopeia (The Queen)**: This distinctive W-shaped constellation is easy to spot in the northern sky! It's circumpolar from most northern latitudes, meaning it never sets. In mythology, Cassiopeia was a vain queen. The constellation helps locate Polaris and is opposite the Big Dipper across the north celestial pole.",
-        'andromeda': "🌌 **Andromeda (The Princess)**: This constellation is famous for containing the Andromeda Galaxy (M31), our nearest major galactic neighbor! The galaxy is visible to the naked eye as a fuzzy patch. In mythology, Andromeda was a princess chained to a rock as sacrifice to a sea monster, but was saved by Perseus.",
-        'scorpio': "🦂 **Scorpio (The Scorpion)**: A spectacular zodiac constellation visible in summer! Its brightest star is Antares, a red supergiant 700 times the size of our Sun. The constellation looks like a scorpion with a curved tail and claws. In mythology, it's the scorpion that killed Orion the Hunter. Best viewed in July and August in the southern sky!",
-        'scorpius': "🦂 **Scorpio (The Scorpion)**: A spectacular zodiac constellation visible in summer! Its brightest star is Antares, a red supergiant 700 times the size of our Sun. The constellation looks like a scorpion with a curved tail and claws. In mythology, it's the scorpion that killed Orion the Hunter. Best viewed in July and August in the southern sky!",
-        'leo': "🦁 **Leo (The Lion)**: A bright zodiac constellation that really looks like a lion! Its brightest star Regulus marks the lion's heart. The 'Sickle' asterism forms the lion's mane and head. Leo is home to many galaxies and the annual Leonid meteor shower in November. Best seen in spring evenings!",
-        'virgo': "♍ **Virgo (The Virgin)**: The second-largest constellation in the sky! Its brightest star Spica is actually a binary star system. Virgo contains over 1,300 galaxies in the Virgo Cluster. In mythology, Virgo represents the goddess of harvest. Best visible in late spring and early summer!",
-        'gemini': "♊ **Gemini (The Twins)**: Features the bright stars Castor and Pollux, representing the twin brothers in Greek mythology! Gemini is a zodiac constellation best seen in winter. It's home to the beautiful open star cluster M35 and was the radiant point for the 2020 SpaceX mission naming!",
-        'cancer': "🦀 **Cancer (The Crab)**: The faintest zodiac constellation, but it contains the beautiful Beehive Cluster (M44)! In mythology, it's the crab that pinched Hercules during his battle with the Hydra. Cancer is best seen in late winter and early spring between Gemini and Leo!",
-        'aquarius': "🏺 **Aquarius (The Water Bearer)**: A large zodiac constellation known for meteor showers! Home to the radiant points of several meteor showers including the Aquarids. Its brightest star is Sadalsuud. Best viewed in autumn evenings in the southern sky!",
-        'pisces': "🐟 **Pisces (The Fishes)**: A large but faint zodiac constellation representing two fish tied together! Contains the vernal equinox point where the Sun crosses the celestial equator in spring. Best seen in autumn evenings, though it requires dark skies due to its faint stars!"
-    }
-    
-    for constellation, info in constellation_data.items():
-        if constellation in user_message:
-            return info
+    info = lookup_fact(CONSTELLATION_LOOKUP, user_message)
+    if info is not None:
+        return info
     
     # General constellation information
     return "✨ **Constellations**: Star patterns that have guided humanity for thousands of years! There are 88 official constellations covering the entire sky. They help us navigate, tell time, and share stories across cultures. Popular northern constellations include Ursa Major (Big Dipper), Orion, and Cassiopeia. Which constellation interests you?"
 
+PLANETS = MappingProxyType({
+    'mercury': "☿️ **Mercury**: The closest planet to the Sun and the smallest in our solar system! It has extreme temperature swings from 800°F (430°C) during the day to -290°F (-180°C) at night. A year on Mercury (88 Earth days) is shorter than its day (176 Earth days)! NASA's MESSENGER mission mapped its entire surface.",
+    'venus': "♀️ **Venus**: Earth's 'evil twin' and the hottest planet in our solar system! Its thick atmosphere of carbon dioxide creates a runaway greenhouse effect, reaching 900°F (480°C) - hot enough to melt lead. It rotates backwards and a day is longer than a year there! Often called the 'Morning Star' or 'Evening Star.'",
+    'earth': "🌍 **Earth**: Our beautiful blue marble and the only known planet with life! 71% covered by oceans, with a perfect distance from the Sun for liquid water. Protected by a magnetic field and ozone layer, it's home to millions of species. NASA monitors Earth's climate and changes from space with dozens of satellites!",
+    'mars': "🔴 **Mars**: The Red Planet, our most explored neighbor! It gets its color from iron oxide (rust) on its surface. Mars has the largest volcano (Olympus Mons) and canyon (Valles Marineris) in the solar system. NASA's rovers have found evidence of ancient rivers and lakes - it may have harbored life billions of years ago!",
+    'jupiter': "🪐 **Jupiter**: The king of planets! This gas giant is so massive it could fit all other planets inside it. Jupiter acts as our cosmic protector, attracting asteroids and comets with its powerful gravity. It has over 80 moons, including the four Galilean moons discovered in 1610. The Great Red Spot is a storm larger than Earth!",
+    'saturn': "🪐 **Saturn**: The jewel of our solar system with its stunning rings! These rings are made of billions of ice and rock particles. Saturn is so light it would float in water! It has 146 known moons, including Titan with its thick atmosphere and liquid methane lakes. NASA's Cassini mission revealed incredible details about Saturn's system.",
+    'uranus': "🌀 **Uranus**: The tilted ice giant! It rotates on its side at a 98-degree angle, possibly due to an ancient collision. Composed mainly of water, methane, and ammonia ices, it appears blue-green due to methane in its atmosphere. It has faint rings and 27 known moons named after Shakespeare characters!",
+    'neptune': "💙 **Neptune**: The windiest planet with speeds up to 1,200 mph (2,000 km/h)! This deep blue ice giant is the farthest known planet from the Sun. It takes 165 Earth years to complete one orbit! Neptune has 16 known moons, with Triton being the largest and orbiting backwards, suggesting it's a captured Kuiper Belt object."
+})
+PLANET_LOOKUP = compile_fact_lookup(PLANETS)
+
 def get_planet_info(user_message):
     """Get information about planets"""
-    planet_data = {
-        'mercury': "☿️ **Mercury**: The closest planet to the Sun and the smallest in our solar system! It has extreme temperature swings from 800°F (430°C) during the day to -290°F (-180°C) at night. A year on Mercury (88 Earth days) is shorter than its day (176 Earth days)! NASA's MESSENGER mission mapped its entire surface.",
-        'venus': "♀️ **Venus**: Earth's 'evil twin' and the hottest planet in our solar system! Its thick atmosphere of carbon dioxide creates a runaway greenhouse effect, reaching 900°F (480°C) - hot enough to melt lead. It rotates backwards and a day is longer than a year there! Often called the 'Morning Star' or 'Evening Star.'",
-        'earth': "🌍 **Earth**: Our beautiful blue marble and the only known planet with life! 71% covered by oceans, with a perfect distance from the Sun for liquid water. Protected by a magnetic field and ozone layer, it's home to millions of species. NASA monitors Earth's climate and changes from space with dozens of satellites!",
-        'mars': "🔴 **Mars**: The Red Planet, our most explored neighbor! It gets its color from iron oxide (rust) on its surface. Mars has the largest volcano (Olympus Mons) and canyon (Valles Marineris) in the solar system. NASA's rovers have found evidence of ancient rivers and lakes - it may have harbored life billions of years ago!",
-        'jupiter': "🪐 **Jupiter**: The king of planets! This gas giant is so massive it could fit all other planets inside it. Jupiter acts as our cosmic protector, attracting asteroids and comets with its powerful gravity. It has over 80 moons, including the four Galilean moons discovered in 1610. The Great Red Spot is a storm larger than Earth!",
-        'saturn': "🪐 **Saturn**: The jewel of our solar system with its stunning rings! These rings are made of billions of ice and rock particles. Saturn is so light it would float in water! It has 146 known moons, including Titan with its thick atmosphere and liquid methane lakes. NASA's Cassini mission revealed incredible details about Saturn's system.",
-        'uranus': "🌀 **Uranus**: The tilted ice giant! It rotates on its side at a 98-degree angle, possibly due to an ancient collision. Composed mainly of water, methane, and ammonia ices, it appears blue-green due to methane in its atmosphere. It has faint rings and 27 known moons named after Shakespeare characters!",
-        'neptune': "💙 **Neptune**: The windiest planet with speeds up to 1,200 mph (2,000 km/h)! This deep blue ice giant is the farthest known planet from the Sun. It takes 165 Earth years to complete one orbit! Neptune has 16 known moons, with Triton being the largest and orbiting backwards, suggesting it's a captured Kuiper Belt object."
-    }
-    
-    for planet, info in planet_data.items():
-        if planet in user_message:
-            return info
+    info = lookup_fact(PLANET_LOOKUP, user_message)
+    if info is not None:
+        return info
     
     return "🪐 **Our Solar System**: Contains 8 amazing planets, each unique! From scorching Mercury to icy Neptune, they show incredible diversity. NASA missions have visited all planets, revolutionizing our understanding. Which planet would you like to explore?"
 
+STELLAR = MappingProxyType({
+    'star': "⭐ **Stars**: Massive nuclear fusion reactors that light up the universe! They fuse hydrogen into helium in their cores, releasing enormous energy. Stars are born in nebulae, live for millions to billions of years, and end as white dwarfs, neutron stars, or black holes depending on their mass.",
+    'sun': "☀️ **Our Sun**: A middle-aged yellow dwarf star that's been shining for 4.6 billion years! Every second, it converts 600 million tons of hydrogen into helium, powering all life on Earth. The Sun's core reaches 27 million°F (15 million°C). Solar activity follows an 11-year cycle monitored by NASA's Solar Dynamics Observatory.",
+    'supernova': "💥 **Supernovae**: The explosive death of massive stars! These cosmic explosions are so bright they can outshine entire galaxies. They create and scatter heavy elements like iron and gold throughout the universe - we are literally made of star stuff! NASA telescopes regularly discover supernovae in distant galaxies.",
+    'neutron star': "⚡ **Neutron Stars**: The ultra-dense remnants of massive stars! A sugar-cube sized piece would weigh 6 billion tons on Earth. They can spin 700 times per second and have magnetic fields trillions of times stronger than Earth's. Some emit radio beams (pulsars) that sweep across space like cosmic lighthouses.",
+    'white dwarf': "💎 **White Dwarfs**: The hot, dense cores left behind when Sun-like stars die! About the size of Earth but with the mass of the Sun. They slowly cool over billions of years, eventually becoming cold, dark objects. Our Sun will become a white dwarf in about 5 billion years.",
+    'black hole': "🕳️ **Black Holes**: Regions of spacetime where gravity is so strong that nothing, not even light, can escape! They form when massive stars collapse. NASA's Event Horizon Telescope captured the first image of a black hole in 2019. The supermassive black hole in our galaxy's center, Sagittarius A*, is 4 million times the Sun's mass!"
+})
+STELLAR_LOOKUP = compile_fact_lookup(STELLAR)
+
 def get_stellar_info(user_message):
     """Get information about stars and stellar objects"""
-    stellar_data = {
-        'star': "⭐ **Stars**: Massive nuclear fusion reactors that light up the universe! They fuse hydrogen into helium in their cores, releasing enormous energy. Stars are born in nebulae, live for millions to billions of years, and end as white dwarfs, neutron stars, or black holes depending on their mass.",
-        'sun': "☀️ **Our Sun**: A middle-aged yellow dwarf star that's been shining for 4.6 billion years! Every second, it converts 600 million tons of hydrogen into helium, powering all life on Earth. The Sun's core reaches 27 million°F (15 million°C). Solar activity follows an 11-year cycle monitored by NASA's Solar Dynamics Observatory.",
-        'supernova': "💥 **Supernovae**: The explosive death of massive stars! These cosmic explosions are so bright they can outshine entire galaxies. They create and scatter heavy elements like iron and gold throughout the universe - we are literally made of star stuff! NASA telescopes regularly discover supernovae in distant galaxies.",
-        'neutron star': "⚡ **Neutron Stars**: The ultra-dense remnants of massive stars! A sugar-cube sized piece would weigh 6 billion tons on Earth. They can spin 700 times per second and have magnetic fields trillions of times stronger than Earth's. Some emit radio beams (pulsars) that sweep across space like cosmic lighthouses.",
-        'white dwarf': "💎 **White Dwarfs**: The hot, dense cores left behind when Sun-like stars die! About the size of Earth but with the mass of the Sun. They slowly cool over billions of years, eventually becoming cold, dark objects. Our Sun will become a white dwarf in about 5 billion years.",
-        'black hole': "🕳️ **Black Holes**: Regions of spacetime where gravity is so strong that nothing, not even light, can escape! They form when massive stars collapse. NASA's Event Horizon Telescope captured the first image of a black hole in 2019. The supermassive black hole in our galaxy's center, Sagittarius A*, is 4 million times the Sun's mass!"
-    }
-    
-    for term, info in stellar_data.items():
-        if term in user_message:
-            return info
+    info = lookup_fact(STELLAR_LOOKUP, user_message)
+    if info is not None:
+        return info
     
     return "⭐ **Stars and Stellar Objects**: The universe is filled with incredible stellar phenomena! From main sequence stars like our Sun to exotic objects like neutron stars and black holes. NASA's space telescopes study these cosmic powerhouses. What stellar object interests you?"
 
+GALAXIES = MappingProxyType({
+    'milky way': "🌌 **The Milky Way**: Our home galaxy containing over 100 billion stars! It's a barred spiral galaxy about 100,000 light-years across. We're located in the Orion Arm, about 26,000 light-years from the galactic center. Our entire solar system orbits the galaxy once every 225-250 million years!",
+    'andromeda galaxy': "🌌 **Andromeda Galaxy (M31)**: Our nearest major galactic neighbor, 2.5 million light-years away! It's approaching us at 250,000 mph and will collide with the Milky Way in about 4.5 billion years, creating a new galaxy astronomers call 'Milkomeda.' You can see it with the naked eye as a fuzzy patch!",
+    'galaxy': "🌌 **Galaxies**: Massive collections of stars, gas, dust, and dark matter! There are over 2 trillion galaxies in the observable universe. They come in three main types: spiral (like the Milky Way), elliptical, and irregular. NASA's Hubble and James Webb telescopes have revealed galaxies from when the universe was young!"
+})
+GALAXY_LOOKUP = compile_fact_lookup(GALAXIES)
+
 def get_galaxy_info(user_message):
     """Get information about galaxies"""
-    galaxy_data = {
-        'milky way': "🌌 **The Milky Way**: Our home galaxy containing over 100 billion stars! It's a barred spiral galaxy about 100,000 light-years across. We're located in the Orion Arm, about 26,000 light-years from the galactic center. Our entire solar system orbits the galaxy once every 225-250 million years!",
-        'andromeda galaxy': "🌌 **Andromeda Galaxy (M31)**: Our nearest major galactic neighbor, 2.5 million light-years away! It's approaching us at 250,000 mph and will collide with the Milky Way in about 4.5 billion years, creating a new galaxy astronomers call 'Milkomeda.' You can see it with the naked eye as a fuzzy patch!",
-        'galaxy': "🌌 **Galaxies**: Massive collections of stars, gas, dust, and dark matter! There are over 2 trillion galaxies in the observable universe. They come in three main types: spiral (like the Milky Way), elliptical, and irregular. NASA's Hubble and James Webb telescopes have revealed galaxies from when the universe was young!"
-    }
-    
-    for term, info in galaxy_data.items():
-        if term in user_message:
-            return info
+    info = lookup_fact(GALAXY_LOOKUP, user_message)
+    if info is not None:
+        return info
     
     return "🌌 **Galaxies**: Island universes containing billions to trillions of stars! Our Milky Way is just one of countless galaxies in the universe. NASA telescopes study galaxy formation and evolution across cosmic time. Which galaxy interests you?"
 
-def get_smart_space_answer(user_message):
+def normalize_message(user_message):
+    """Lowercase a message and collapse its whitespace; done once per request before matching and caching"""
+    return ' '.join(user_message.lower().split())
+
+async def get_smart_space_answer(user_message):
     """Use Google Gemini AI to provide intelligent answers to any space question"""
     try:
         if model is None:
             return get_random_space_fact()
         
-        # Create a space-expert prompt for Gemini
-        prompt = f"""You are VyomNetra, an expert space and astronomy chatbot. Answer this question about space, astronomy, constellations, planets, or any space-related topic with accurate, engaging information. Keep your response informative but friendly, include relevant emojis, and make it educational.
-
-User question: {user_message}
-
-Please provide a detailed, accurate answer about the space topic they're asking about. If it's about a constellation, include information about its stars, mythology, and how to find it. If it's about planets, include facts about their characteristics and any NASA missions. Make it interesting and educational!"""
-
-        response = model.generate_content(prompt)
-        return response.text
+        # Repeat questions are answered from memory instead of another Gemini round-trip
+        answer = GEMINI_CACHE.get(user_message)
+        if answer is None:
+            response = await asyncio.wait_for(model.generate_content_async(user_message), timeout=GEMINI_TIMEOUT)
+            answer = GEMINI_CACHE[user_message] = response.text
+        return answer
         
     except Exception as e:
         print(f"Gemini AI error: {e}")
         # Fallback to random space facts if AI fails
         return get_random_space_fact()
 
+# Intent classifier, in priority order: the first intent listed wins when several match
+INTENTS = [
+    ('apod', ['apod', 'picture', 'photo', 'image'], lambda message: get_nasa_apod()),
+    ('neo', ['asteroid', 'neo', 'near earth'], lambda message: get_nasa_neo_data()),
+    ('mars', ['mars', 'rover', 'curiosity'], lambda message: get_mars_rover_data()),
+    ('spacex', ['spacex', 'launch', 'rocket'], lambda message: get_spacex_launch_data()),
+    ('isro', ['isro', 'indian space', 'india'], lambda message: get_isro_info()),
+    ('constellation', ['ursa major', 'ursa minor', 'orion', 'cassiopeia', 'andromeda', 'constellation', 'big dipper', 'little dipper'], get_constellation_info),
+    ('planet', ['mercury', 'venus', 'earth', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'planet'], get_planet_info),
+    ('stellar', ['star', 'sun', 'supernova', 'neutron star', 'white dwarf', 'black hole'], get_stellar_info),
+    ('galaxy', ['galaxy', 'milky way', 'andromeda galaxy', 'spiral galaxy'], get_galaxy_info),
+]
+
+# One alternation per intent, wrapped in a lookahead so overlapping keywords are all reported
+INTENT_PATTERN = re.compile('(?=' + '|'.join(
+    f'(?P<{name}>' + '|'.join(map(re.escape, keywords)) + ')' for name, keywords, _ in INTENTS
+) + ')')
+# Dispatch table resolved at import: a match's group number (minus one) indexes its intent's handler
+INTENT_HANDLERS = tuple(handler for _, _, handler in INTENTS)
+
+INTENT_SEPARATOR = '\n\n---\n\n'
+
+def match_intents(user_message):
+    """Return the handlers of all intents mentioned in the message, highest priority first"""
+    # Each keyword counts once: a match overlapping an earlier one ('earth' in 'near earth') is skipped
+    matched = set()
+    covered = 0
+    for m in INTENT_PATTERN.finditer(user_message):
+        if m.start() >= covered:
+            matched.add(m.lastindex)
+            covered = m.end(m.lastindex)
+    return [INTENT_HANDLERS[group - 1] for group in sorted(matched)]
+
 if __name__ == '__main__':
     print("🚀 Starting VyomNetra Space Chat Backend...")
     print("🌌 Connecting to NASA and space agency APIs...")
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    import uvicorn
+    # loop/http default to 'auto': uvloop and httptools from uvicorn[standard] are used when installed
+    uvicorn.run(
+        'main:app',
+        host='0.0.0.0',
+        port=int(os.environ.get('PORT', 5000)),
+        workers=int(os.environ.get('WEB_CONCURRENCY', 1)),
+        timeout_keep_alive=30,
+        proxy_headers=True,
+    )
\ No newline at end of file